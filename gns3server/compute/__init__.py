@@ -35,3 +35,6 @@ if sys.platform.startswith("linux") or hasattr(sys, "_called_from_test") or os.e
         MODULES.append(Docker)
         from .iou import IOU
         MODULES.append(IOU)
+
+# the list of modules is fixed once the supported modules are known
+MODULES = tuple(MODULES)
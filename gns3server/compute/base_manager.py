@@ -21,6 +21,7 @@ import struct
 import stat
 import asyncio
 import aiofiles
+import threading
 
 import aiohttp
 import socket
@@ -62,6 +63,8 @@ class BaseManager:
     def __init__(self):
 
         BaseManager._convert_lock = asyncio.Lock()
+        # only one image scan at a time, a waiting scan reuses the digests cached by the previous one
+        self._list_images_lock = asyncio.Lock()
         self._nodes = {}
         self._port_manager = None
         self._config = Config.instance()
@@ -587,8 +590,14 @@ class BaseManager:
         :returns: Array of hash
         """
 
+        stopped_event = threading.Event()
         try:
-            return list_images(self._NODE_TYPE)
+            async with self._list_images_lock:
+                return await wait_run_in_executor(list_images, self._NODE_TYPE, stopped_event=stopped_event)
+        except asyncio.CancelledError:
+            # stop the scan and md5sum computation running in the executor
+            stopped_event.set()
+            raise
         except OSError as e:
             raise aiohttp.web.HTTPConflict(text="Can not list images {}".format(e))
 
@@ -2303,19 +2303,19 @@ class QemuVM(BaseNode):
                 except AttributeError:
                     pass
         answer["hda_disk_image"] = self.manager.get_relative_image_path(self._hda_disk_image, self.project.path)
-        answer["hda_disk_image_md5sum"] = md5sum(self._hda_disk_image)
+        answer["hda_disk_image_md5sum"] = md5sum(self._hda_disk_image, check_cache=False)
         answer["hdb_disk_image"] = self.manager.get_relative_image_path(self._hdb_disk_image, self.project.path)
-        answer["hdb_disk_image_md5sum"] = md5sum(self._hdb_disk_image)
+        answer["hdb_disk_image_md5sum"] = md5sum(self._hdb_disk_image, check_cache=False)
         answer["hdc_disk_image"] = self.manager.get_relative_image_path(self._hdc_disk_image, self.project.path)
-        answer["hdc_disk_image_md5sum"] = md5sum(self._hdc_disk_image)
+        answer["hdc_disk_image_md5sum"] = md5sum(self._hdc_disk_image, check_cache=False)
         answer["hdd_disk_image"] = self.manager.get_relative_image_path(self._hdd_disk_image, self.project.path)
-        answer["hdd_disk_image_md5sum"] = md5sum(self._hdd_disk_image)
+        answer["hdd_disk_image_md5sum"] = md5sum(self._hdd_disk_image, check_cache=False)
         answer["cdrom_image"] = self.manager.get_relative_image_path(self._cdrom_image, self.project.path)
-        answer["cdrom_image_md5sum"] = md5sum(self._cdrom_image)
+        answer["cdrom_image_md5sum"] = md5sum(self._cdrom_image, check_cache=False)
         answer["bios_image"] = self.manager.get_relative_image_path(self._bios_image, self.project.path)
-        answer["bios_image_md5sum"] = md5sum(self._bios_image)
+        answer["bios_image_md5sum"] = md5sum(self._bios_image, check_cache=False)
         answer["initrd"] = self.manager.get_relative_image_path(self._initrd, self.project.path)
-        answer["initrd_md5sum"] = md5sum(self._initrd)
+        answer["initrd_md5sum"] = md5sum(self._initrd, check_cache=False)
         answer["kernel_image"] = self.manager.get_relative_image_path(self._kernel_image, self.project.path)
-        answer["kernel_image_md5sum"] = md5sum(self._kernel_image)
+        answer["kernel_image_md5sum"] = md5sum(self._kernel_image, check_cache=False)
         return answer
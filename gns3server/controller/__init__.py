@@ -20,6 +20,7 @@ import sys
 import json
 import uuid
 import socket
+import asyncio
 import shutil
 import aiohttp
 
@@ -102,12 +103,19 @@ class Controller:
         except aiohttp.web.HTTPConflict:
             log.fatal("Cannot access to the local server, make sure something else is not running on the TCP port {}".format(port))
             sys.exit(1)
-        for c in computes:
+
+        async def add_saved_compute(settings):
             try:
-                await self.add_compute(**c)
+                await self.add_compute(**settings)
             except (aiohttp.web.HTTPError, KeyError):
                 pass  # Skip not available servers at loading
 
+        # connect to the computes concurrently so an unreachable compute doesn't delay the others
+        results = await asyncio.gather(*[add_saved_compute(c) for c in computes], return_exceptions=True)
+        for compute_settings, result in zip(computes, results):
+            if isinstance(result, Exception):
+                log.error("Could not load compute '{}': {}".format(compute_settings.get("compute_id"), result), exc_info=result)
+
         try:
             await self.gns3vm.auto_start_vm()
         except GNS3VMError as e:
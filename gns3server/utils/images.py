@@ -25,12 +25,16 @@ from . import force_unix_path
 import logging
 log = logging.getLogger(__name__)
 
+MD5SUM_CHUNK_SIZE = 1024 * 1024  # 1MB
 
-def list_images(type):
+
+def list_images(type, stopped_event=None):
     """
     Scan directories for available image for a type
 
     :param type: emulator type (dynamips, qemu, iou)
+    :param stopped_event: In case you execute this function on thread and would like to have possibility
+                          to cancel operation pass the `threading.Event`
     """
     files = set()
     images = []
@@ -53,9 +57,12 @@ def list_images(type):
         directory = os.path.normpath(directory)
         for root, _, filenames in _os_walk(directory, recurse=recurse):
             for filename in filenames:
+                if stopped_event is not None and stopped_event.is_set():
+                    log.error("Listing of {} images has stopped due to cancellation".format(type))
+                    return images
                 path = os.path.join(root, filename)
                 if filename not in files:
-                    if filename.endswith(".md5sum") or filename.startswith("."):
+                    if filename.endswith(".md5sum") or filename.endswith(".md5sum.key") or filename.startswith("."):
                         continue
                     elif ((filename.endswith(".image") or filename.endswith(".bin")) and type == "dynamips") \
                             or ((filename.endswith(".bin") or filename.startswith("i86bi")) and type == "iou") \
@@ -80,7 +87,7 @@ def list_images(type):
                             images.append({
                                 "filename": filename,
                                 "path": force_unix_path(path),
-                                "md5sum": md5sum(os.path.join(root, filename)),
+                                "md5sum": md5sum(os.path.join(root, filename), stopped_event=stopped_event),
                                 "filesize": os.stat(os.path.join(root, filename)).st_size})
                         except OSError as e:
                             log.warning("Can't add image {}: {}".format(path, str(e)))
@@ -143,24 +150,50 @@ def images_directories(type):
     return [force_unix_path(p) for p in paths if os.path.exists(p)]
 
 
-def md5sum(path, stopped_event=None):
+def _image_key(path):
+    """
+    Return the values identifying the content of an image without reading it
+
+    :param path: Path to the image
+    :returns: String with the size, modification time and inode of the image
+    """
+
+    st = os.stat(path)
+    return "{} {} {}".format(st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def md5sum(path, stopped_event=None, check_cache=True):
     """
     Return the md5sum of an image and cache it on disk
 
     :param path: Path to the image
     :param stopped_event: In case you execute this function on thread and would like to have possibility
                           to cancel operation pass the `threading.Event`
+    :param check_cache: If False, a cached digest is returned without checking the image has not changed
+                        since it was computed. The image is still hashed when there is no cached digest.
     :returns: Digest of the image
     """
 
     if path is None or len(path) == 0 or not os.path.exists(path):
         return None
 
+    try:
+        image_key = _image_key(path)
+    except OSError as e:
+        log.error("Can't create digest of %s: %s", path, str(e))
+        return None
+
     try:
         with open(path + '.md5sum') as f:
             md5 = f.read().strip()
-            if len(md5) == 32:
+        if len(md5) == 32:
+            if not check_cache:
                 return md5
+            # the key file has the size, modification time and inode of the image when the digest was computed,
+            # the digest is computed again if it is missing (e.g. digest cached by an older version)
+            with open(path + '.md5sum.key') as f:
+                if f.read().strip() == image_key:
+                    return md5
     # Unicode error is when user rename an image to .md5sum ....
     except (OSError, UnicodeDecodeError):
         pass
@@ -168,11 +201,18 @@ def md5sum(path, stopped_event=None):
     try:
         m = hashlib.md5()
         with open(path, 'rb') as f:
+            if hasattr(os, "posix_fadvise"):
+                # images are read once from start to end, let the kernel read ahead more aggressively
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
             while True:
                 if stopped_event is not None and stopped_event.is_set():
                     log.error("MD5 sum calculation of `{}` has stopped due to cancellation".format(path))
                     return
-                buf = f.read(128)
+                # the GIL is released while hashing large buffers
+                buf = f.read(MD5SUM_CHUNK_SIZE)
                 if not buf:
                     break
                 m.update(buf)
@@ -184,6 +224,8 @@ def md5sum(path, stopped_event=None):
     try:
         with open('{}.md5sum'.format(path), 'w+') as f:
             f.write(digest)
+        with open('{}.md5sum.key'.format(path), 'w+') as f:
+            f.write(image_key)
     except OSError as e:
         log.error("Can't write digest of %s: %s", path, str(e))
 
@@ -195,6 +237,6 @@ def remove_checksum(path):
     Remove the checksum of an image from cache if exists
     """
 
-    path = '{}.md5sum'.format(path)
-    if os.path.exists(path):
-        os.remove(path)
+    for checksum_path in ('{}.md5sum'.format(path), '{}.md5sum.key'.format(path)):
+        if os.path.exists(checksum_path):
+            os.remove(checksum_path)
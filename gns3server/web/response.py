@@ -26,6 +26,13 @@ import jinja2
 import sys
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # orjson is not installed with Python 3.6, the standard json module is used instead
+    ORJSON_AVAILABLE = False
+
 from ..utils.get_resource import get_resource
 from ..version import __version__
 
@@ -112,7 +119,15 @@ class Response(aiohttp.web.Response):
             except jsonschema.ValidationError as e:
                 log.error("Invalid output query. JSON schema error: {}".format(e.message))
                 raise aiohttp.web.HTTPBadRequest(text="{}".format(e))
-        self.body = json.dumps(answer, indent=4, sort_keys=True).encode('utf-8')
+        if ORJSON_AVAILABLE:
+            try:
+                self.body = orjson.dumps(answer, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+                return
+            except TypeError:
+                # orjson doesn't support some types the json module does (e.g. integers larger than 64-bit)
+                pass
+        # same formatting as orjson
+        self.body = json.dumps(answer, indent=2, sort_keys=True, ensure_ascii=False).encode('utf-8')
 
     async def stream_file(self, path, status=200, set_content_type=None, set_content_length=True):
         """
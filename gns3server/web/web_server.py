@@ -65,6 +65,7 @@ class WebServer:
         self._running = False
         self._closing = False
         self._ssl_context = None
+        self._list_images_task = None
 
     @staticmethod
     def instance(host=None, port=None):
@@ -124,18 +125,21 @@ class WebServer:
         if self._app:
             await self._app.cleanup()
 
+        if self._list_images_task and not self._list_images_task.done():
+            log.debug("Cancelling the image list computation")
+            self._list_images_task.cancel()
+            await asyncio.gather(self._list_images_task, return_exceptions=True)
+
         await Controller.instance().stop()
 
-        for module in MODULES:
-            log.debug("Unloading module {}".format(module.__name__))
-            m = module.instance()
-            await m.unload()
+        await self._unload_modules()
 
-        if PortManager.instance().tcp_ports:
-            log.warning("TCP ports are still used {}".format(PortManager.instance().tcp_ports))
+        port_manager = PortManager.instance()
+        if port_manager.tcp_ports:
+            log.warning("TCP ports are still used %s", port_manager.tcp_ports)
 
-        if PortManager.instance().udp_ports:
-            log.warning("UDP ports are still used {}".format(PortManager.instance().udp_ports))
+        if port_manager.udp_ports:
+            log.warning("UDP ports are still used %s", port_manager.udp_ports)
 
         try:
             tasks = asyncio.all_tasks()
@@ -151,6 +155,33 @@ class WebServer:
 
         self._loop.stop()
 
+    async def _unload_modules(self):
+        """
+        Unloads the compute modules concurrently.
+        An error while unloading a module doesn't prevent the other modules to be unloaded.
+        """
+
+        log.debug("Unloading modules {}".format(", ".join(module.__name__ for module in MODULES)))
+        results = await asyncio.gather(*(module.instance().unload() for module in MODULES), return_exceptions=True)
+        for module, result in zip(MODULES, results):
+            if isinstance(result, Exception):
+                log.error("Could not unload module {}: {}".format(module.__name__, result), exc_info=result)
+
+    @staticmethod
+    def _set_event_loop_policy():
+        """
+        Use the faster libuv based event loop when available.
+        """
+
+        if sys.platform.startswith("win"):
+            return
+        try:
+            import uvloop
+        except ImportError:
+            return
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        log.info("Using uvloop {} as the event loop".format(uvloop.__version__))
+
     def ssl_context(self):
         """
         Returns the SSL context for the server.
@@ -182,7 +213,7 @@ class WebServer:
             callback = functools.partial(signal_handler, signal_name)
             if sys.platform.startswith("win"):
                 # add_signal_handler() is not yet supported on Windows
-                signal.signal(getattr(signal, signal_name), callback)
+                signal.signal(getattr(signal, signal_name), functools.partial(self._loop.call_soon_threadsafe, callback))
             else:
                 self._loop.add_signal_handler(getattr(signal, signal_name), callback)
 
@@ -239,7 +270,7 @@ class WebServer:
         # Because with a large image collection
         # without md5sum already computed we start the
         # computing with server start
-        asyncio.ensure_future(Qemu.instance().list_images())
+        self._list_images_task = asyncio.ensure_future(Qemu.instance().list_images())
 
     def run(self):
         """
@@ -254,11 +285,14 @@ class WebServer:
         logger = logging.getLogger("asyncio")
         logger.setLevel(logging.ERROR)
 
-        if sys.platform.startswith("win"):
+        self._set_event_loop_policy()
+
+        if sys.platform.startswith("win") and sys.version_info < (3, 8):
             loop = asyncio.get_event_loop()
             # Add a periodic callback to give a chance to process signals on Windows
             # because asyncio.add_signal_handler() is not supported yet on that platform
             # otherwise the loop runs outside of signal module's ability to trap signals.
+            # Since Python 3.8 the proactor event loop is woken up by signals.
 
             def wakeup():
                 loop.call_later(0.5, wakeup)
@@ -304,7 +338,8 @@ class WebServer:
             "https://gns3.github.io": resource_options
         })
 
-        PortManager.instance().console_host = self._host
+        port_manager = PortManager.instance()
+        port_manager.console_host = self._host
 
         for method, route, handler in Route.get_routes():
             log.debug("Adding route: {} {}".format(method, route))
@@ -312,8 +347,7 @@ class WebServer:
 
         for module in MODULES:
             log.debug("Loading module {}".format(module.__name__))
-            m = module.instance()
-            m.port_manager = PortManager.instance()
+            module.instance().port_manager = port_manager
 
         log.info("Starting server on {}:{}".format(self._host, self._port))
 
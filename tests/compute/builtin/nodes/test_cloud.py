@@ -153,7 +153,8 @@ async def test_update_port_mappings(loop, on_gns3vm, compute_project):
     assert cloud.ports_mapping == ports1
 
 
-async def test_linux_ethernet_raw_add_nio(loop, linux_platform, compute_project, nio):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_linux_ethernet_raw_add_nio(loop, fake_platform, compute_project, nio):
     ports = [
         {
             "interface": "eth0",
@@ -180,7 +181,8 @@ async def test_linux_ethernet_raw_add_nio(loop, linux_platform, compute_project,
     ])
 
 
-async def test_linux_ethernet_raw_add_nio_bridge(loop, linux_platform, compute_project, nio):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_linux_ethernet_raw_add_nio_bridge(loop, fake_platform, compute_project, nio):
     """
     Bridge can't be connected directly to a cloud we use a tap in the middle
     """
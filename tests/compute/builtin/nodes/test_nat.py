@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import uuid
+import pytest
 from unittest.mock import MagicMock, patch
 
 from gns3server.compute.builtin.nodes.nat import Nat
@@ -40,7 +41,8 @@ def test_json_gns3vm(on_gns3vm, compute_project):
     }
 
 
-def test_json_darwin(darwin_platform, compute_project):
+@pytest.mark.parametrize("fake_platform", ["darwin10.10"], indirect=True)
+def test_json_darwin(fake_platform, compute_project):
 
     with patch("gns3server.utils.interfaces.interfaces", return_value=[
             {"name": "eth0", "special": False, "type": "ethernet"},
@@ -62,7 +64,8 @@ def test_json_darwin(darwin_platform, compute_project):
     }
 
 
-def test_json_windows_with_full_name_of_interface(windows_platform, project):
+@pytest.mark.parametrize("fake_platform", ["win10"], indirect=True)
+def test_json_windows_with_full_name_of_interface(fake_platform, project):
     with patch("gns3server.utils.interfaces.interfaces", return_value=[
             {"name": "VMware Network Adapter VMnet8", "special": True, "type": "ethernet"}]):
         nat = Nat("nat1", str(uuid.uuid4()), project, MagicMock())
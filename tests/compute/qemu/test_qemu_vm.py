@@ -529,7 +529,8 @@ async def test_build_command_manual_uuid(vm):
         assert vm.id not in cmd
 
 
-async def test_build_command_kvm(linux_platform, vm, fake_qemu_binary):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_build_command_kvm(fake_platform, vm, fake_qemu_binary):
     """
     Qemu 2.4 introduce an issue with KVM
     """
@@ -565,7 +566,8 @@ async def test_build_command_kvm(linux_platform, vm, fake_qemu_binary):
             ]
 
 
-async def test_build_command_kvm_2_4(linux_platform, vm, fake_qemu_binary):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_build_command_kvm_2_4(fake_platform, vm, fake_qemu_binary):
     """
     Qemu 2.4 introduce an issue with KVM
     """
@@ -813,7 +815,8 @@ def test_initrd_asa(vm, images_dir):
         assert mock.called
 
 
-def test_options(linux_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+def test_options(fake_platform, vm):
     vm.kvm = False
     vm.options = "-usb"
     assert vm.options == "-usb"
@@ -832,7 +835,8 @@ def test_options(linux_platform, vm):
     assert vm.options == "-icount 12 -machine accel=tcg"
 
 
-def test_options_windows(windows_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["win10"], indirect=True)
+def test_options_windows(fake_platform, vm):
     vm.options = "-no-kvm"
     assert vm.options == "-machine accel=tcg"
 
@@ -856,19 +860,22 @@ def test_get_qemu_img(vm, tmpdir):
 #         vm._get_qemu_img()
 
 
-async def test_run_with_hardware_acceleration_darwin(darwin_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["darwin10.10"], indirect=True)
+async def test_run_with_hardware_acceleration_darwin(fake_platform, vm):
 
     vm.manager.config.set("Qemu", "enable_hardware_acceleration", False)
     assert await vm._run_with_hardware_acceleration("qemu-system-x86_64", "") is False
 
 
-async def test_run_with_hardware_acceleration_windows(windows_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["win10"], indirect=True)
+async def test_run_with_hardware_acceleration_windows(fake_platform, vm):
 
     vm.manager.config.set("Qemu", "enable_hardware_acceleration", False)
     assert await vm._run_with_hardware_acceleration("qemu-system-x86_64", "") is False
 
 
-async def test_run_with_kvm_linux(linux_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_run_with_kvm_linux(fake_platform, vm):
 
     with patch("os.path.exists", return_value=True) as os_path:
         vm.manager.config.set("Qemu", "enable_kvm", True)
@@ -876,14 +883,16 @@ async def test_run_with_kvm_linux(linux_platform, vm):
         os_path.assert_called_with("/dev/kvm")
 
 
-async def test_run_with_kvm_linux_options_no_kvm(linux_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_run_with_kvm_linux_options_no_kvm(fake_platform, vm):
 
     with patch("os.path.exists", return_value=True) as os_path:
         vm.manager.config.set("Qemu", "enable_kvm", True)
         assert await vm._run_with_hardware_acceleration("qemu-system-x86_64", "-machine accel=tcg") is False
 
 
-async def test_run_with_kvm_not_x86(linux_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_run_with_kvm_not_x86(fake_platform, vm):
 
     with patch("os.path.exists", return_value=True):
         vm.manager.config.set("Qemu", "enable_kvm", True)
@@ -891,7 +900,8 @@ async def test_run_with_kvm_not_x86(linux_platform, vm):
             await vm._run_with_hardware_acceleration("qemu-system-arm", "")
 
 
-async def test_run_with_kvm_linux_dev_kvm_missing(linux_platform, vm):
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+async def test_run_with_kvm_linux_dev_kvm_missing(fake_platform, vm):
 
     with patch("os.path.exists", return_value=False):
         vm.manager.config.set("Qemu", "enable_kvm", True)
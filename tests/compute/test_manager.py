@@ -17,9 +17,13 @@
 
 import uuid
 import os
+import time
+import asyncio
 import pytest
+import threading
 from unittest.mock import patch, MagicMock
 from tests.utils import asyncio_patch
+from gns3server.utils.asyncio import wait_run_in_executor
 
 from gns3server.compute.vpcs import VPCS
 from gns3server.compute.dynamips import Dynamips
@@ -283,6 +287,45 @@ async def test_list_images_directory_not_exist(qemu):
         assert await qemu.list_images() == []
 
 
+async def test_list_images_cancelled(qemu):
+
+    scan_started = threading.Event()
+    stopped_events = []
+
+    def fake_list_images(node_type, stopped_event=None):
+        stopped_events.append(stopped_event)
+        scan_started.set()
+        # emulate a long scan which stops when cancelled
+        stopped_event.wait(5)
+        return []
+
+    with patch("gns3server.compute.base_manager.list_images", side_effect=fake_list_images):
+        task = asyncio.ensure_future(qemu.list_images())
+        await wait_run_in_executor(scan_started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert len(stopped_events) == 1
+    assert stopped_events[0].is_set()
+
+
+async def test_list_images_one_scan_at_a_time(qemu):
+
+    running_scans = []
+    max_running_scans = []
+
+    def fake_list_images(node_type, stopped_event=None):
+        running_scans.append(node_type)
+        max_running_scans.append(len(running_scans))
+        time.sleep(0.1)
+        running_scans.pop()
+        return []
+
+    with patch("gns3server.compute.base_manager.list_images", side_effect=fake_list_images):
+        await asyncio.gather(qemu.list_images(), qemu.list_images())
+    assert max_running_scans == [1, 1]
+
+
 async def test_delete_node(vpcs, compute_project):
 
     compute_project._nodes = set()
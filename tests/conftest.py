@@ -4,9 +4,10 @@ import tempfile
 import shutil
 import weakref
 
+from concurrent.futures import ThreadPoolExecutor
+
 from aiohttp import web
 from unittest.mock import MagicMock, patch
-from pathlib import Path
 
 from gns3server.web.route import Route
 from gns3server.controller import Controller
@@ -20,10 +21,21 @@ from gns3server.handlers import *
 from .handlers.api.base import Query
 
 sys._called_from_test = True
-sys.original_platform = sys.platform
+
+# Temporary directories are removed in the background to not slow down each test teardown
+_cleanup_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Wait for the removal of the temporary directories
+    """
+
+    _cleanup_executor.shutdown(wait=True)
 
 
-if sys.platform.startswith("win"):
+# The proactor event loop is the default on Windows since Python 3.8
+if sys.platform.startswith("win") and sys.version_info < (3, 8):
     @pytest.yield_fixture(scope="session")
     def loop(request):
         """Return an event loop and destroy it at the end of test"""
@@ -34,6 +46,14 @@ if sys.platform.startswith("win"):
         asyncio.set_event_loop(None)
 
 
+def _touch(path):
+    """
+    Create an empty file
+    """
+
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+
+
 @pytest.fixture(scope='function')
 async def http_client(aiohttp_client):
 
@@ -56,7 +76,7 @@ def controller(tmpdir, controller_config_path):
     Controller._instance = None
     controller = Controller.instance()
     os.makedirs(os.path.dirname(controller_config_path), exist_ok=True)
-    Path(controller_config_path).touch()
+    _touch(controller_config_path)
     controller._config_file = controller_config_path
     controller._config_loaded = True
     return controller
@@ -168,47 +188,23 @@ def free_console_port(port_manager, compute_project):
 
 
 @pytest.fixture
-def darwin_platform():
-    """
-    Change sys.plaform to Darwin
-    """
-
-    old_platform = sys.platform
-    sys.platform = "darwin10.10"
-    yield
-    sys.plaform = old_platform
-
-
-@pytest.fixture
-def windows_platform():
-    """
-    Change sys.platform to Windows
-    """
-
-    old_platform = sys.platform
-    sys.platform = "win10"
-    yield
-    sys.plaform = old_platform
-
-
-@pytest.fixture
-def linux_platform():
+def fake_platform(monkeypatch, request):
     """
-    Change sys.platform to Linux
+    Change sys.platform to the value given with indirect parametrization, e.g.
+    @pytest.mark.parametrize("fake_platform", ["darwin10.10"], indirect=True)
     """
 
-    old_platform = sys.platform
-    sys.platform = "linuxdebian"
-    yield
-    sys.plaform = old_platform
+    monkeypatch.setattr(sys, "platform", request.param)
+    yield request.param
 
 
 @pytest.fixture
-def on_gns3vm(linux_platform):
+def on_gns3vm(monkeypatch):
     """
     Mock the hostname to  emulate the GNS3 VM
     """
 
+    monkeypatch.setattr(sys, "platform", "linuxdebian")
     with patch("gns3server.utils.interfaces.interfaces", return_value=[
             {"name": "eth0", "special": False, "type": "ethernet"},
             {"name": "eth1", "special": False, "type": "ethernet"},
@@ -232,7 +228,7 @@ def ubridge_path(config):
 
     path = config.get_section_config("Server").get("ubridge_path")
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    open(path, 'w+').close()
+    _touch(path)
     return path
 
 
@@ -242,12 +238,17 @@ def run_around_tests(monkeypatch, config, port_manager):#port_manager, controlle
     This setup a temporary project file environment around tests
     """
 
-    tmppath = tempfile.mkdtemp()
+    # Use a RAM backed filesystem when available to speed up the file operations,
+    # unless a temporary directory has been explicitly configured
+    tmpdir = None
+    if os.path.isdir("/dev/shm") and not any(os.environ.get(name) for name in ("TMPDIR", "TEMP", "TMP")):
+        tmpdir = "/dev/shm"
+    tmppath = tempfile.mkdtemp(dir=tmpdir)
 
     for module in MODULES:
         module._instance = None
 
-    os.makedirs(os.path.join(tmppath, 'projects'))
+    os.mkdir(os.path.join(tmppath, 'projects'))
     config.set("Server", "projects_path", os.path.join(tmppath, 'projects'))
     config.set("Server", "symbols_path", os.path.join(tmppath, 'symbols'))
     config.set("Server", "images_path", os.path.join(tmppath, 'images'))
@@ -266,13 +267,7 @@ def run_around_tests(monkeypatch, config, port_manager):#port_manager, controlle
 
     monkeypatch.setattr("gns3server.utils.path.get_default_project_directory", lambda *args: os.path.join(tmppath, 'projects'))
 
-    # Force sys.platform to the original value. Because it seem not be restore correctly at each tests
-    sys.platform = sys.original_platform
-
     yield
 
     # An helper should not raise Exception
-    try:
-        shutil.rmtree(tmppath)
-    except BaseException:
-        pass
+    _cleanup_executor.submit(shutil.rmtree, tmppath, ignore_errors=True)
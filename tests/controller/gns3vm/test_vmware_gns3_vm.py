@@ -34,7 +34,8 @@ def vmx_path(tmpdir):
     return str(tmpdir / "vmwware_vm.vmx")
 
 
-async def test_set_extra_options(gns3vm, vmx_path, windows_platform):
+@pytest.mark.parametrize("fake_platform", ["win10"], indirect=True)
+async def test_set_extra_options(gns3vm, vmx_path, fake_platform):
 
     gns3vm._vmx_path = vmx_path
 
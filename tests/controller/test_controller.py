@@ -288,6 +288,36 @@ async def test_start(controller):
     assert controller.computes["local"].name == socket.gethostname()
 
 
+async def test_start_with_computes(controller):
+
+    controller.gns3vm.settings = {
+        "enable": False,
+        "engine": "vmware",
+        "vmname": "GNS3 VM"
+    }
+
+    computes = [{"compute_id": compute_id, "name": compute_id, "protocol": "http", "host": "localhost", "port": 3081}
+                for compute_id in ("test1", "test2", "test3", "test4")]
+    connected = []
+
+    async def connect(compute):
+        if compute.id == "test2":
+            raise aiohttp.web.HTTPConflict(text="The server test2 is unavailable")
+        if compute.id == "test3":
+            raise RuntimeError("Unexpected error")
+        connected.append(compute.id)
+
+    with patch("gns3server.controller.Controller._load_controller_settings", return_value=computes):
+        with patch.object(Compute, "connect", connect):
+            with patch("gns3server.controller.log.error") as mock_log:
+                await controller.start()
+
+    # computes failing to connect don't prevent the other computes to be added
+    assert sorted(connected) == ["local", "test1", "test4"]
+    assert mock_log.call_count == 1
+    assert "test3" in mock_log.call_args[0][0]
+
+
 async def test_start_vm(controller):
     """
     Start the controller with a GNS3 VM
@@ -23,7 +23,8 @@ from gns3server.version import __version__
 
 
 @pytest.mark.skipif(sys.platform.startswith("win"), reason="Not supported on Windows")
-async def test_get(compute_api, windows_platform):
+@pytest.mark.parametrize("fake_platform", ["win10"], indirect=True)
+async def test_get(compute_api, fake_platform):
 
     response = await compute_api.get('/capabilities')
     assert response.status == 200
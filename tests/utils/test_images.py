@@ -48,6 +48,12 @@ def test_images_directories(tmpdir):
         assert len(res) == 3
 
 
+def _image_key(path):
+
+    st = os.stat(path)
+    return '{} {} {}'.format(st.st_size, st.st_mtime_ns, st.st_ino)
+
+
 def test_md5sum(tmpdir):
 
     fake_img = str(tmpdir / 'hello载')
@@ -58,6 +64,8 @@ def test_md5sum(tmpdir):
     assert md5sum(fake_img) == '5d41402abc4b2a76b9719d911017c592'
     with open(str(tmpdir / 'hello载.md5sum')) as f:
         assert f.read() == '5d41402abc4b2a76b9719d911017c592'
+    with open(str(tmpdir / 'hello载.md5sum.key')) as f:
+        assert f.read() == _image_key(fake_img)
 
 
 def test_md5sum_stopped_event(tmpdir):
@@ -82,10 +90,73 @@ def test_md5sum_existing_digest(tmpdir):
 
     with open(str(tmpdir / 'hello.md5sum'), 'w+') as f:
         f.write('aaaaa02abc4b2a76b9719d911017c592')
+    with open(str(tmpdir / 'hello.md5sum.key'), 'w+') as f:
+        f.write(_image_key(fake_img))
 
     assert md5sum(fake_img) == 'aaaaa02abc4b2a76b9719d911017c592'
 
 
+def test_md5sum_existing_digest_without_key(tmpdir):
+
+    fake_img = str(tmpdir / 'hello')
+
+    with open(fake_img, 'w+') as f:
+        f.write('hello')
+
+    # digest cached by an older version
+    with open(str(tmpdir / 'hello.md5sum'), 'w+') as f:
+        f.write('aaaaa02abc4b2a76b9719d911017c592')
+
+    assert md5sum(fake_img, check_cache=False) == 'aaaaa02abc4b2a76b9719d911017c592'
+    assert md5sum(fake_img) == '5d41402abc4b2a76b9719d911017c592'
+    with open(str(tmpdir / 'hello.md5sum')) as f:
+        assert f.read() == '5d41402abc4b2a76b9719d911017c592'
+    with open(str(tmpdir / 'hello.md5sum.key')) as f:
+        assert f.read() == _image_key(fake_img)
+
+
+def test_md5sum_outdated_digest(tmpdir):
+
+    fake_img = str(tmpdir / 'hello')
+
+    with open(fake_img, 'w+') as f:
+        f.write('hello')
+    st = os.stat(fake_img)
+    assert md5sum(fake_img) == '5d41402abc4b2a76b9719d911017c592'
+
+    # the image is modified in place with a different size but the same modification time
+    with open(fake_img, 'w+') as f:
+        f.write('hello world')
+    os.utime(fake_img, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    # the cached digest is still returned when the cache is not checked
+    assert md5sum(fake_img, check_cache=False) == '5d41402abc4b2a76b9719d911017c592'
+    assert md5sum(fake_img) == '5eb63bbbe01eeed093cb22bb8f5acdc3'
+    with open(str(tmpdir / 'hello.md5sum')) as f:
+        assert f.read() == '5eb63bbbe01eeed093cb22bb8f5acdc3'
+
+
+def test_md5sum_replaced_image(tmpdir):
+
+    fake_img = str(tmpdir / 'hello')
+
+    with open(fake_img, 'w+') as f:
+        f.write('hello')
+    st = os.stat(fake_img)
+    assert md5sum(fake_img) == '5d41402abc4b2a76b9719d911017c592'
+
+    # the image is replaced by another file with the same size and modification time (e.g. cp -p)
+    new_img = str(tmpdir / 'world')
+    with open(new_img, 'w+') as f:
+        f.write('world')
+    os.utime(new_img, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(new_img, fake_img)
+
+    assert md5sum(fake_img) == '7d793037a0760186574b0282f2f435e7'
+    with open(str(tmpdir / 'hello.md5sum')) as f:
+        assert f.read() == '7d793037a0760186574b0282f2f435e7'
+
+
 def test_md5sum_existing_digest_but_missing_image(tmpdir):
 
     fake_img = str(tmpdir / 'hello')
@@ -105,9 +176,12 @@ def test_remove_checksum(tmpdir):
 
     with open(str(tmpdir / 'hello.md5sum'), 'w+') as f:
         f.write('aaaaa02abc4b2a76b9719d911017c592')
+    with open(str(tmpdir / 'hello.md5sum.key'), 'w+') as f:
+        f.write('5 1 1')
     remove_checksum(str(tmpdir / 'hello'))
 
     assert not os.path.exists(str(tmpdir / 'hello.md5sum'))
+    assert not os.path.exists(str(tmpdir / 'hello.md5sum.key'))
 
     remove_checksum(str(tmpdir / 'not_exists'))
 
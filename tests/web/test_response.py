@@ -17,6 +17,7 @@
 
 import pytest
 
+from unittest.mock import patch
 from tests.utils import AsyncioMagicMock
 from aiohttp.web import HTTPNotFound
 
@@ -44,3 +45,26 @@ async def test_response_file_not_found(loop, tmpdir, response):
     filename = str(tmpdir / 'hello-not-found')
     with pytest.raises(HTTPNotFound):
         await response.stream_file(filename)
+
+
+def test_response_json(response):
+
+    pytest.importorskip("orjson")
+    response.json({"b": 1, "a": [2, "é"]})
+    assert response.content_type == "application/json"
+    assert response.body == '{\n  "a": [\n    2,\n    "é"\n  ],\n  "b": 1\n}'.encode("utf-8")
+
+
+def test_response_json_fallback(response):
+
+    # orjson doesn't support integers larger than 64-bit
+    response.json({"b": 1, "a": [2 ** 70, "é"]})
+    assert response.content_type == "application/json"
+    assert response.body == '{{\n  "a": [\n    {},\n    "é"\n  ],\n  "b": 1\n}}'.format(2 ** 70).encode("utf-8")
+
+
+def test_response_json_without_orjson(response):
+
+    with patch("gns3server.web.response.ORJSON_AVAILABLE", False):
+        response.json({"b": 1, "a": [2, "é"]})
+    assert response.body == '{\n  "a": [\n    2,\n    "é"\n  ],\n  "b": 1\n}'.encode("utf-8")
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import asyncio
+import pytest
+
+from unittest.mock import MagicMock, patch
+
+from gns3server.web.web_server import WebServer
+
+
+def fake_module(name, error=None):
+    """
+    Create a compute module class recording when it is unloaded
+    """
+
+    class FakeModule:
+
+        unloaded = False
+
+        @classmethod
+        def instance(cls):
+            return cls
+
+        @classmethod
+        async def unload(cls):
+            if error:
+                raise error
+            cls.unloaded = True
+
+    FakeModule.__name__ = name
+    return FakeModule
+
+
+async def test_unload_modules(loop):
+
+    modules = (fake_module("VPCS"), fake_module("Qemu", error=OSError("Cannot unload")), fake_module("Docker"))
+    with patch("gns3server.web.web_server.MODULES", modules):
+        with patch("gns3server.web.web_server.log.error") as mock_log:
+            await WebServer("127.0.0.1", 3080)._unload_modules()
+
+    # an error while unloading a module doesn't prevent the other modules to be unloaded
+    assert modules[0].unloaded
+    assert not modules[1].unloaded
+    assert modules[2].unloaded
+    assert mock_log.call_count == 1
+    assert mock_log.call_args[0][0] == "Could not unload module Qemu: Cannot unload"
+
+
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+def test_set_event_loop_policy_uvloop(fake_platform):
+
+    uvloop = MagicMock(__version__="0.16.0")
+    with patch.dict(sys.modules, {"uvloop": uvloop}):
+        with patch("asyncio.set_event_loop_policy") as mock:
+            WebServer._set_event_loop_policy()
+    mock.assert_called_with(uvloop.EventLoopPolicy.return_value)
+
+
+@pytest.mark.parametrize("fake_platform", ["linuxdebian"], indirect=True)
+def test_set_event_loop_policy_without_uvloop(fake_platform):
+
+    # a None entry in sys.modules makes the import fail
+    with patch.dict(sys.modules, {"uvloop": None}):
+        with patch("asyncio.set_event_loop_policy") as mock:
+            WebServer._set_event_loop_policy()
+    assert not mock.called
+
+
+@pytest.mark.parametrize("fake_platform", ["win10"], indirect=True)
+def test_set_event_loop_policy_windows(fake_platform):
+
+    with patch.dict(sys.modules, {"uvloop": MagicMock()}):
+        with patch("asyncio.set_event_loop_policy") as mock:
+            WebServer._set_event_loop_policy()
+    assert not mock.called
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="uvloop is not supported on Windows")
+def test_set_event_loop_policy_installs_uvloop():
+
+    uvloop = pytest.importorskip("uvloop")
+    policy = asyncio.get_event_loop_policy()
+    try:
+        WebServer._set_event_loop_policy()
+        assert isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+    finally:
+        asyncio.set_event_loop_policy(policy)